@@ -7,7 +7,7 @@ Tracks prospect mentions across fantasy baseball subreddits and (optionally)
 news articles via GNews API. Calculates a "Buzz Score" (0-100) from Reddit.
 
 Setup:
-1. Install: pip install -r requirements.txt  (praw, python-dotenv, requests)
+1. Install: pip install -r requirements.txt  (praw, python-dotenv, requests, numpy)
 2. Reddit app at https://www.reddit.com/prefs/apps (script, redirect http://localhost:8080)
 3. Optional: GNews API key at https://gnews.io/register for news scraping
 4. Create .env with credentials (see EXAMPLE_ENV in code)
@@ -17,21 +17,44 @@ Author: Rankle System
 """
 
 import praw
+import numpy as np
+from dotenv import load_dotenv
 import json
 import math
 import time
 import os
 import re
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Optional
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     requests = None  # type: ignore
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # type: ignore
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None  # type: ignore
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
@@ -44,6 +67,9 @@ REDDIT_USER_AGENT=ProspectBuzzTracker/1.0 by YourUsername
 
 # Optional: GNews API for news article scraping (get key at https://gnews.io/register)
 # GNEWS_API_KEY=your_gnews_api_key_here
+
+# Optional: write buzz_results.json.zst instead of buzz_results.json (pip install zstandard)
+# COMPRESS_RESULTS=1
 """
 
 # Target subreddits with weights
@@ -70,11 +96,38 @@ NEGATIVE_KEYWORDS = [
 # Algorithm parameters
 DECAY_LAMBDA = 0.1  # Half-life ~7 days
 DAYS_TO_TRACK = 30
+SECONDS_PER_DAY = 24 * 3600
+# exp(-lambda * days) for whole days 0..DAYS_TO_TRACK (ages are clamped into range)
+DECAY_TABLE = tuple(math.exp(-DECAY_LAMBDA * d) for d in range(DAYS_TO_TRACK + 1))
+_DECAY_TABLE_ARR = np.array(DECAY_TABLE)
 MAX_SINGLE_POST_CONTRIBUTION = 0.25  # Cap at 25% of total
+MENTION_BASE_POINTS = {"title": 10, "body": 5, "comment": 2}
+MENTION_SENTIMENT_MOD = {"positive": 1.2, "negative": 0.7, "neutral": 1.0}
 
-# Rate limiting
+# Rate limiting (shared by all worker threads)
 REQUESTS_PER_MINUTE = 60
-REQUEST_DELAY = 1.0  # seconds between requests (safe margin)
+REQUEST_DELAY = 1.0  # seconds between requests (fallback when no rate-limit headers)
+RATELIMIT_MIN_REMAINING = 5  # start pacing when Reddit reports this few requests left
+MAX_WORKERS = 8  # prospects scanned concurrently (I/O-bound)
+
+# Batched Reddit search: one OR query covers many prospects per subreddit
+MAX_QUERY_LENGTH = 500  # Reddit search rejects queries over ~512 chars
+MAX_PROSPECTS_PER_QUERY = 20
+BULK_SEARCH_LIMIT = 250  # posts per (subreddit, batch) query
+REDDIT_PAGE_SIZE = 100  # listing items per API request
+MATCH_BODY_CHARS = 2000  # only the start of a post body is scanned for names/clues
+
+# Local cache of Reddit search results (re-runs skip repeat API calls)
+SEARCH_CACHE_FILE = "search_cache.sqlite"
+SEARCH_CACHE_TTL = 6 * 3600  # seconds
+
+# Reddit OAuth token reused across runs (skips re-auth on cold start)
+TOKEN_CACHE_FILE = Path.home() / ".cache" / "prospect-scraper" / "token.json"
+TOKEN_EXPIRY_MARGIN = 60  # seconds; refresh tokens this close to expiring
+
+# HTTP connection pooling (shared by all worker threads)
+HTTP_POOL_CONNECTIONS = 8
+HTTP_POOL_MAXSIZE = 32
 
 # News API (GNews) - optional
 GNEWS_BASE_URL = "https://gnews.io/api/v4/search"
@@ -88,14 +141,33 @@ NEWS_SENTIMENT_NEGATIVE = -1.0  # negative news hurts score
 NEWS_SENTIMENT_NEUTRAL = 0.3    # neutral news slight positive
 MAX_SINGLE_NEWS_CONTRIBUTION = 0.25  # cap single article impact
 
+# Output: buzz_results.json, or buzz_results.json.zst when opted in with
+# COMPRESS_RESULTS=1 in .env (requires: pip install zstandard)
+RESULTS_ZSTD_LEVEL = 6
+NEWS_SENTIMENT_MOD = {
+    "positive": NEWS_SENTIMENT_POSITIVE,
+    "negative": NEWS_SENTIMENT_NEGATIVE,
+    "neutral": NEWS_SENTIMENT_NEUTRAL,
+}
+
+
+def _keyword_pattern(keywords: list[str]) -> re.Pattern:
+    """Compile a keyword list into one case-insensitive whole-word regex"""
+    alternation = "|".join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True))
+    return re.compile(rf"\b(?:{alternation})\b", re.IGNORECASE)
+
+
+_POSITIVE_RE = _keyword_pattern(POSITIVE_KEYWORDS)
+_NEGATIVE_RE = _keyword_pattern(NEGATIVE_KEYWORDS)
+
 
 def analyze_sentiment(text: str) -> str:
     """Shared keyword-based sentiment for Reddit and news (positive/negative/neutral)."""
     if not text:
         return "neutral"
-    text_lower = text.lower()
-    pos_count = sum(1 for kw in POSITIVE_KEYWORDS if kw in text_lower)
-    neg_count = sum(1 for kw in NEGATIVE_KEYWORDS if kw in text_lower)
+    # Count distinct keywords hit (not repeats), one regex scan per polarity
+    pos_count = len({kw.lower() for kw in _POSITIVE_RE.findall(text)})
+    neg_count = len({kw.lower() for kw in _NEGATIVE_RE.findall(text)})
     if neg_count > pos_count:
         return "negative"
     if pos_count > neg_count:
@@ -103,11 +175,92 @@ def analyze_sentiment(text: str) -> str:
     return "neutral"
 
 
+class TokenBucket:
+    """Thread-safe token bucket so concurrent workers share one request budget"""
+
+    def __init__(self, capacity: int, refill_per_sec: float):
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                elapsed = now - self.last_refill
+                self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_sec)
+                self.last_refill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.refill_per_sec
+            time.sleep(wait)
+
+
+class HeaderRateLimiter:
+    """Paces Reddit requests from its X-Ratelimit-* headers, shared by all workers"""
+
+    def __init__(self, fallback: TokenBucket, min_remaining: int = RATELIMIT_MIN_REMAINING):
+        self.fallback = fallback
+        self.min_remaining = min_remaining
+        self.remaining = None  # requests left in the current window
+        self.reset_at = None   # Unix time the window resets
+        self.lock = threading.Lock()
+
+    def response_hook(self, response, *args, **kwargs):
+        """requests response hook: record X-Ratelimit-Remaining / X-Ratelimit-Reset.
+
+        Reads the raw headers so it works on every PRAW/prawcore version.
+        """
+        remaining = response.headers.get("x-ratelimit-remaining")
+        reset_in = response.headers.get("x-ratelimit-reset")  # seconds until reset
+        if remaining is None or reset_in is None:
+            return
+        try:
+            remaining, reset_at = float(remaining), time.time() + float(reset_in)
+        except ValueError:
+            return
+        with self.lock:
+            self.remaining = remaining
+            self.reset_at = reset_at
+
+    def acquire(self):
+        """Wait only as long as the reported quota requires"""
+        now = time.time()
+        with self.lock:
+            remaining, reset_at = self.remaining, self.reset_at
+            if remaining is not None:
+                self.remaining = remaining - 1  # reserve so other workers see it
+        if remaining is None or reset_at <= now:
+            # No headers yet (or the window expired): fixed-rate fallback
+            self.fallback.acquire()
+        elif remaining <= self.min_remaining:
+            time.sleep((reset_at - now) / max(remaining, 1))
+
+
+def pooled_session(retry: bool = False):
+    """requests.Session with a connection pool sized for MAX_WORKERS threads"""
+    session = requests.Session()
+    max_retries = 0
+    if retry:
+        max_retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=max_retries,
+    )
+    session.mount("https://", adapter)
+    return session
+
+
 # ============================================================================
 # DATA CLASSES
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class NewsArticle:
     """A news article mentioning a prospect"""
     title: str
@@ -119,8 +272,21 @@ class NewsArticle:
     sentiment: str = "neutral"   # positive / negative / neutral
     contribution: float = 0.0   # computed buzz contribution (can be negative)
 
+    def to_dict(self) -> dict:
+        """Flat dict for JSON output (cheaper than dataclasses.asdict)"""
+        return {
+            "title": self.title,
+            "url": self.url,
+            "source": self.source,
+            "published_at": self.published_at,
+            "published_ts": self.published_ts,
+            "description": self.description,
+            "sentiment": self.sentiment,
+            "contribution": self.contribution,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class Mention:
     """A single mention of a prospect on Reddit"""
     id: str
@@ -136,8 +302,25 @@ class Mention:
     confidence: float
     contribution: float = 0.0  # Calculated buzz contribution
 
+    def to_dict(self) -> dict:
+        """Flat dict for JSON output (cheaper than dataclasses.asdict)"""
+        return {
+            "id": self.id,
+            "subreddit": self.subreddit,
+            "type": self.type,
+            "title": self.title,
+            "text": self.text,
+            "score": self.score,
+            "num_comments": self.num_comments,
+            "created_utc": self.created_utc,
+            "url": self.url,
+            "sentiment": self.sentiment,
+            "confidence": self.confidence,
+            "contribution": self.contribution,
+        }
+
 
-@dataclass 
+@dataclass(slots=True)
 class Prospect:
     """A prospect being tracked"""
     id: str
@@ -146,9 +329,26 @@ class Prospect:
     team: str
     position: str = ""
     aliases: list = field(default_factory=list)  # Alternative names/nicknames
+    _name_re: Optional[re.Pattern] = field(default=None, init=False, repr=False, compare=False)
+    _clue_re: Optional[re.Pattern] = field(default=None, init=False, repr=False, compare=False)
+
+    def patterns(self) -> tuple[re.Pattern, re.Pattern]:
+        """Cached (name, context-clue) regexes used to classify Reddit posts"""
+        if self._name_re is None:
+            full_name = re.escape(f"{self.first_name} {self.last_name}")
+            last_name = re.escape(self.last_name)
+            # Lookarounds rather than \b so names ending in punctuation ("Jr.") still match
+            self._name_re = re.compile(
+                rf"(?<!\w)(?:(?P<full>{full_name})|(?P<last>{last_name}))(?!\w)", re.IGNORECASE
+            )
+            # Team/position codes are case-sensitive so "OF", "MIN", "SEA" don't match plain words
+            clues = [f"(?-i:{re.escape(c)})" for c in (self.team, self.position) if c]
+            clues += ["prospects?", "minors", "minor league"]
+            self._clue_re = re.compile(rf"(?<!\w)(?:{'|'.join(clues)})(?!\w)", re.IGNORECASE)
+        return self._name_re, self._clue_re
 
 
-@dataclass
+@dataclass(slots=True)
 class BuzzResult:
     """Buzz score calculation result for a prospect"""
     prospect_id: str
@@ -160,10 +360,27 @@ class BuzzResult:
     mention_count_30d: int
     days_with_mentions: int
     negative_ratio: float
-    mentions: list
-    news_articles: list = field(default_factory=list)
+    mentions: list  # Mention objects; converted to dicts only when saving
+    news_articles: list = field(default_factory=list)  # NewsArticle objects
     last_updated: str = ""  # set in calculate_buzz_result
 
+    def to_dict(self) -> dict:
+        """Dict for JSON output"""
+        return {
+            "prospect_id": self.prospect_id,
+            "name": self.name,
+            "team": self.team,
+            "buzz_score": self.buzz_score,
+            "raw_buzz": self.raw_buzz,
+            "mention_count_7d": self.mention_count_7d,
+            "mention_count_30d": self.mention_count_30d,
+            "days_with_mentions": self.days_with_mentions,
+            "negative_ratio": self.negative_ratio,
+            "mentions": [m.to_dict() for m in self.mentions],
+            "news_articles": [a.to_dict() for a in self.news_articles],
+            "last_updated": self.last_updated,
+        }
+
 
 # ============================================================================
 # NEWS SCRAPER (GNews API)
@@ -176,7 +393,8 @@ class NewsScraper:
         if not requests:
             raise RuntimeError("Install requests: pip install requests")
         self.api_key = api_key
-        self.session = requests.Session()
+        self.bucket = TokenBucket(1, 1 / GNEWS_REQUEST_DELAY)
+        self.session = pooled_session(retry=True)  # one pool, reused by all threads
 
     def search_prospect(self, prospect: Prospect) -> list[NewsArticle]:
         """Search for recent news articles about a prospect"""
@@ -188,7 +406,7 @@ class NewsScraper:
             "apikey": self.api_key,
         }
         try:
-            time.sleep(GNEWS_REQUEST_DELAY)
+            self.bucket.acquire()
             resp = self.session.get(GNEWS_BASE_URL, params=params, timeout=15)
             resp.raise_for_status()
             data = resp.json()
@@ -234,6 +452,162 @@ class NewsScraper:
         return articles
 
 
+# ============================================================================
+# LOCAL CACHES (search results, OAuth token)
+# ============================================================================
+
+class SearchCache:
+    """SQLite cache of Reddit search results keyed by (subreddit, term, week)"""
+
+    def __init__(self, path: str, ttl: int = SEARCH_CACHE_TTL):
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("CREATE TABLE IF NOT EXISTS c (k TEXT PRIMARY KEY, ts INTEGER, v TEXT)")
+        # Expired rows are never served again; purge them so the file doesn't grow forever
+        self.db.execute("DELETE FROM c WHERE ts < ?", (int(time.time()) - ttl,))
+        self.db.commit()
+
+    @staticmethod
+    def key(subreddit: str, term: str, limit: int) -> str:
+        week = datetime.now(timezone.utc).strftime("%G-%V")
+        return f"{subreddit}|{term}|{limit}|{week}"
+
+    def get(self, key: str) -> Optional[list[dict]]:
+        """Return cached rows, or None if missing or older than the TTL"""
+        with self.lock:
+            row = self.db.execute("SELECT ts, v FROM c WHERE k = ?", (key,)).fetchone()
+        if not row or time.time() - row[0] > self.ttl:
+            return None
+        return json.loads(row[1])
+
+    def set(self, key: str, rows: list[dict]):
+        with self.lock:
+            self.db.execute(
+                "REPLACE INTO c VALUES (?, ?, ?)", (key, int(time.time()), json.dumps(rows))
+            )
+            self.db.commit()
+
+
+class TokenStore:
+    """Shares one Reddit OAuth token across worker threads and across runs.
+
+    Handles both prawcore authorizer layouts: wall-clock ``_expiration_timestamp``
+    (prawcore 2.x) and monotonic ``_expiration_timestamp_ns`` (prawcore >= 3).
+    The stored expiry is always wall-clock so it survives restarts.
+    """
+
+    def __init__(self, client_id: str, path: Path = TOKEN_CACHE_FILE):
+        self.client_id = client_id
+        self.path = path
+        self.lock = threading.Lock()
+        self.token = None
+        self.expires_at = 0.0
+        self.scopes = []
+        try:
+            data = json.loads(path.read_text())
+            if data.get("client_id") == client_id:  # never reuse another app's token
+                self.token = data["access_token"]
+                self.expires_at = float(data["expires_at"])
+                self.scopes = data.get("scopes", [])
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+    def apply(self, reddit):
+        """Install the stored token on a Reddit instance if it is still valid"""
+        with self.lock:
+            if not self.token or self.expires_at <= time.time() + TOKEN_EXPIRY_MARGIN:
+                return
+            authorizer = getattr(getattr(reddit, "_core", None), "_authorizer", None)
+            if authorizer is None:
+                return  # unknown PRAW internals; it will authenticate normally
+            try:
+                if hasattr(authorizer, "_expiration_timestamp_ns"):
+                    remaining_ns = int((self.expires_at - time.time()) * 1e9)
+                    authorizer._expiration_timestamp_ns = time.monotonic_ns() + remaining_ns
+                elif hasattr(authorizer, "_expiration_timestamp"):
+                    authorizer._expiration_timestamp = self.expires_at
+                else:
+                    return  # unknown PRAW internals; it will authenticate normally
+                authorizer.access_token = self.token
+                authorizer.scopes = set(self.scopes)
+                valid = authorizer.is_valid()
+            except Exception:
+                valid = False
+            if not valid:
+                # Undo the injection and forget the stored token for good
+                authorizer.access_token = None
+                self.token = None
+                try:
+                    self.path.unlink()
+                except OSError:
+                    pass
+
+    def capture(self, reddit):
+        """Remember (and persist) the token PRAW is currently using"""
+        try:
+            authorizer = reddit._core._authorizer
+            token = authorizer.access_token
+            if hasattr(authorizer, "_expiration_timestamp_ns"):
+                remaining_ns = authorizer._expiration_timestamp_ns - time.monotonic_ns()
+                expires_at = time.time() + remaining_ns / 1e9
+            else:
+                expires_at = float(authorizer._expiration_timestamp)
+            scopes = sorted(authorizer.scopes or [])
+        except (AttributeError, TypeError):
+            return
+        with self.lock:
+            if not token or token == self.token:
+                return
+            self.token, self.expires_at, self.scopes = token, expires_at, scopes
+            data = {
+                "client_id": self.client_id,
+                "access_token": token,
+                "expires_at": expires_at,
+                "scopes": scopes,
+            }
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                # Bearer token: owner read/write only
+                fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                os.chmod(self.path, 0o600)  # tighten files left by older runs
+                with os.fdopen(fd, "w") as f:
+                    f.write(json.dumps(data))
+            except OSError as e:
+                print(f"    Warning: could not save Reddit token: {e}")
+
+
+def _post_row(post) -> dict:
+    """Plain-dict copy of the submission fields _process_post reads"""
+    return {
+        "id": post.id,
+        "title": post.title,
+        "selftext": post.selftext or "",
+        "score": post.score,
+        "num_comments": post.num_comments,
+        "created_utc": int(post.created_utc),
+        "permalink": post.permalink,
+    }
+
+
+def _name_hit(name_re: re.Pattern, text: str) -> Optional[str]:
+    """"full" if the full name appears in text, "last" if only the last name, else None"""
+    hit = None
+    for match in name_re.finditer(text):
+        if match.lastgroup == "full":
+            return "full"
+        hit = "last"
+    return hit
+
+
+def _batch_label(prospects: list[Prospect]) -> str:
+    """Short human-readable name list for log messages"""
+    names = [f"{p.first_name} {p.last_name}" for p in prospects[:3]]
+    if len(prospects) > 3:
+        names.append(f"+{len(prospects) - 3} more")
+    return ", ".join(names)
+
+
 # ============================================================================
 # REDDIT CLIENT
 # ============================================================================
@@ -241,66 +615,128 @@ class NewsScraper:
 class RedditBuzzScraper:
     """Scrapes Reddit for prospect mentions and calculates buzz scores"""
     
-    def __init__(self, client_id: str, client_secret: str, user_agent: str):
-        """Initialize Reddit API connection"""
-        self.reddit = praw.Reddit(
-            client_id=client_id,
-            client_secret=client_secret,
-            user_agent=user_agent,
-        )
+    def __init__(self, client_id: str, client_secret: str, user_agent: str,
+                 cache: Optional[SearchCache] = None):
+        """Initialize Reddit API connection settings"""
+        self.cache = cache
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.user_agent = user_agent
+        self.tokens = TokenStore(client_id)
+        self.session = pooled_session()  # PRAW does its own retries
+        self.limiter = HeaderRateLimiter(TokenBucket(REQUESTS_PER_MINUTE, 1 / REQUEST_DELAY))
+        self.session.hooks["response"].append(self.limiter.response_hook)
         self.request_count = 0
-        self.last_request_time = 0
-        
+        self._count_lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def reddit(self) -> praw.Reddit:
+        """Per-thread Reddit instance (PRAW is not thread-safe) over a shared pool"""
+        if not hasattr(self._local, "reddit"):
+            self._local.reddit = praw.Reddit(
+                client_id=self.client_id,
+                client_secret=self.client_secret,
+                user_agent=self.user_agent,
+                requestor_kwargs={"session": self.session},
+            )
+        self.tokens.apply(self._local.reddit)
+        return self._local.reddit
+
     def _rate_limit(self):
-        """Enforce rate limiting"""
-        now = time.time()
-        elapsed = now - self.last_request_time
-        if elapsed < REQUEST_DELAY:
-            time.sleep(REQUEST_DELAY - elapsed)
-        self.last_request_time = time.time()
-        self.request_count += 1
-        
-        if self.request_count % 10 == 0:
-            print(f"  [{self.request_count} requests made]")
+        """Enforce rate limiting across all worker threads"""
+        self.limiter.acquire()
+        with self._count_lock:
+            self.request_count += 1
+            count = self.request_count
+
+        if count % 10 == 0:
+            print(f"  [{count} requests made]")
     
     def search_prospect(self, prospect: Prospect, limit_per_sub: int = 100) -> list[Mention]:
         """Search for all mentions of a prospect across target subreddits"""
-        mentions = []
-        search_terms = self._build_search_terms(prospect)
-        
+        return self.search_prospects_bulk([prospect], limit_per_sub)[0]
+
+    def search_prospects_bulk(self, prospects: list[Prospect],
+                              limit_per_sub: int = BULK_SEARCH_LIMIT) -> list[list[Mention]]:
+        """Search for a batch of prospects with one OR query per subreddit.
+
+        Returns one deduplicated mention list per prospect, in input order.
+        Callers should keep batches within the limits of batch_prospects().
+        """
+        mentions = [[] for _ in prospects]
+
         for subreddit_name, weight in SUBREDDITS.items():
-            print(f"  Searching r/{subreddit_name}...")
-            
-            try:
-                subreddit = self.reddit.subreddit(subreddit_name)
-                
-                for term in search_terms:
-                    self._rate_limit()
-                    
-                    # Search posts
-                    try:
-                        for post in subreddit.search(term, time_filter="month", limit=limit_per_sub):
-                            mention = self._process_post(post, prospect, subreddit_name)
-                            if mention:
-                                mentions.append(mention)
-                    except Exception as e:
-                        print(f"    Warning: Search error for '{term}': {e}")
+            seen_ids = set()  # (post, group) pairs; duplicates are skipped before any processing
+            for group, posts in self._search_batch(subreddit_name, list(range(len(prospects))),
+                                                   prospects, limit_per_sub):
+                # Demux each post back to every prospect in the group it mentions
+                for post in posts:
+                    if (post.id, group[0]) in seen_ids:
                         continue
-                        
-            except Exception as e:
-                print(f"    Error accessing r/{subreddit_name}: {e}")
-                continue
-        
-        # Deduplicate by ID
-        seen_ids = set()
-        unique_mentions = []
-        for m in mentions:
-            if m.id not in seen_ids:
-                seen_ids.add(m.id)
-                unique_mentions.append(m)
-        
-        return unique_mentions
-    
+                    seen_ids.add((post.id, group[0]))
+                    for idx in group:
+                        mention = self._process_post(post, prospects[idx], subreddit_name)
+                        if mention:
+                            mentions[idx].append(mention)
+
+        return mentions
+
+    def _search_batch(self, subreddit_name: str, group: list[int], prospects: list[Prospect],
+                      limit: int) -> list[tuple[list[int], list]]:
+        """OR-search one subreddit for prospects[group] as (group, posts) pairs.
+
+        A full listing means some matches were cut off, so the group is split in
+        half and each half re-queried until the results fit (or one prospect is left).
+        """
+        batch = [prospects[idx] for idx in group]
+        query = " OR ".join(term for p in batch for term in self._build_search_terms(p))
+        try:
+            posts = self._search(subreddit_name, query, limit)
+        except Exception as e:
+            print(f"    Warning: Search error in r/{subreddit_name} for {_batch_label(batch)}: {e}")
+            return []
+
+        if len(posts) < limit:
+            return [(group, posts)]
+        if len(group) == 1:
+            print(f"    Warning: r/{subreddit_name} returned the full {limit} posts for "
+                  f"{_batch_label(batch)}; older mentions may be missed")
+            return [(group, posts)]
+        mid = len(group) // 2
+        return (self._search_batch(subreddit_name, group[:mid], prospects, limit)
+                + self._search_batch(subreddit_name, group[mid:], prospects, limit))
+
+    def batch_prospects(self, prospects: list[Prospect]) -> list[list[Prospect]]:
+        """Split prospects into batches whose OR query fits Reddit's length limit"""
+        batches = []
+        batch, length = [], 0
+        for prospect in prospects:
+            terms_length = sum(len(t) + len(" OR ") for t in self._build_search_terms(prospect))
+            if batch and (length + terms_length > MAX_QUERY_LENGTH
+                          or len(batch) >= MAX_PROSPECTS_PER_QUERY):
+                batches.append(batch)
+                batch, length = [], 0
+            batch.append(prospect)
+            length += terms_length
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _search(self, subreddit_name: str, term: str, limit: int) -> list:
+        """Search a subreddit for the past month, serving repeats from the cache"""
+        key = SearchCache.key(subreddit_name, term, limit)
+        rows = self.cache.get(key) if self.cache else None
+        if rows is None:
+            for _ in range(math.ceil(limit / REDDIT_PAGE_SIZE)):
+                self._rate_limit()
+            subreddit = self.reddit.subreddit(subreddit_name)
+            rows = [_post_row(post) for post in subreddit.search(term, time_filter="month", limit=limit)]
+            self.tokens.capture(self.reddit)
+            if self.cache:
+                self.cache.set(key, rows)
+        return [SimpleNamespace(**row) for row in rows]
+
     def _build_search_terms(self, prospect: Prospect) -> list[str]:
         """Build search terms for a prospect"""
         terms = [
@@ -313,42 +749,43 @@ class RedditBuzzScraper:
     
     def _process_post(self, post, prospect: Prospect, subreddit: str) -> Optional[Mention]:
         """Process a Reddit post and extract mention data"""
-        # Check if prospect is actually mentioned
-        full_name = f"{prospect.first_name} {prospect.last_name}".lower()
-        title_lower = post.title.lower()
-        body_lower = (post.selftext or "").lower()
-        
+        # Check if prospect is actually mentioned (case-insensitive regexes, no lowering)
+        name_re, clue_re = prospect.patterns()
+        title = post.title
+        raw_body = post.selftext or ""
+        body = raw_body[:MATCH_BODY_CHARS]  # enough context for a name check
+        title_hit = _name_hit(name_re, title)
+        body_hit = _name_hit(name_re, body) if title_hit != "full" else None
+
         # Determine mention type and confidence
         mention_type = None
         confidence = 0.0
-        
-        if full_name in title_lower:
+
+        if title_hit == "full":
             mention_type = "title"
             confidence = 1.0
-        elif full_name in body_lower:
+        elif body_hit == "full":
             mention_type = "body"
             confidence = 1.0
-        elif prospect.last_name.lower() in title_lower or prospect.last_name.lower() in body_lower:
+        elif title_hit or body_hit:
             # Last name only - check for context
-            text_combined = title_lower + " " + body_lower
-            context_clues = [prospect.team.lower(), "prospect", prospect.position.lower(), "minors", "minor league"]
-            if any(clue in text_combined for clue in context_clues if clue):
-                mention_type = "title" if prospect.last_name.lower() in title_lower else "body"
+            if clue_re.search(title) or clue_re.search(body):
+                mention_type = "title" if title_hit else "body"
                 confidence = 0.8
         
         if not mention_type or confidence == 0:
             return None
         
         # Analyze sentiment (shared with news)
-        text_combined = post.title + " " + (post.selftext or "")
+        text_combined = title + " " + raw_body
         sentiment = analyze_sentiment(text_combined)
         
         return Mention(
             id=post.id,
             subreddit=subreddit,
             type=mention_type,
-            title=post.title,
-            text=(post.selftext or "")[:500],  # Truncate for storage
+            title=title,
+            text=raw_body[:500],  # Truncate for storage
             score=post.score,
             num_comments=post.num_comments,
             created_utc=int(post.created_utc),
@@ -361,6 +798,31 @@ class RedditBuzzScraper:
 # BUZZ SCORE CALCULATOR
 # ============================================================================
 
+def _contributions_numpy(base_points, score, num_comments, sub_weight, days_old, sentiment_mod, confidence):
+    """Per-mention buzz contributions as fused NumPy array ops"""
+    # Engagement multiplier (logarithmic; log10(1 + 0) == 0 when no comments)
+    engagement = 1 + np.log10(1 + score) + 0.5 * np.log10(1 + num_comments)
+    decay = np.take(_DECAY_TABLE_ARR, np.clip(days_old, 0, DAYS_TO_TRACK))
+    return base_points * engagement * sub_weight * decay * sentiment_mod * confidence
+
+
+def _contributions_loop(base_points, score, num_comments, sub_weight, days_old, sentiment_mod, confidence):
+    """Same math as _contributions_numpy as one explicit loop (compiled by numba)"""
+    out = np.empty_like(score)
+    for i in range(score.size):
+        engagement = 1.0 + math.log10(1.0 + score[i]) + 0.5 * math.log10(1.0 + num_comments[i])
+        decay = _DECAY_TABLE_ARR[min(max(days_old[i], 0), DAYS_TO_TRACK)]
+        out[i] = base_points[i] * engagement * sub_weight[i] * decay * sentiment_mod[i] * confidence[i]
+    return out
+
+
+# numba (optional) fuses the loop without NumPy's per-op temporaries
+if njit:
+    _mention_contributions = njit(cache=True, fastmath=True)(_contributions_loop)
+else:
+    _mention_contributions = _contributions_numpy
+
+
 class BuzzCalculator:
     """Calculates buzz scores from mentions"""
     
@@ -368,85 +830,99 @@ class BuzzCalculator:
         self.all_raw_scores = []  # For normalization across prospects
     
     def calculate_raw_buzz(self, mentions: list[Mention]) -> float:
-        """Calculate raw buzz score from mentions"""
-        now = datetime.now(timezone.utc)
-        total = 0.0
-        
-        for mention in mentions:
-            # Base points by mention type
-            base_points = {"title": 10, "body": 5, "comment": 2}.get(mention.type, 2)
-            
-            # Engagement multiplier (logarithmic)
-            engagement = 1 + math.log10(1 + mention.score)
-            if mention.num_comments > 0:
-                engagement += 0.5 * math.log10(1 + mention.num_comments)
-            
-            # Subreddit weight
-            sub_weight = SUBREDDITS.get(mention.subreddit, 1.0)
-            
-            # Recency decay
-            mention_time = datetime.fromtimestamp(mention.created_utc, tz=timezone.utc)
-            days_old = (now - mention_time).days
-            decay = math.exp(-DECAY_LAMBDA * days_old)
-            
-            # Sentiment modifier
-            sentiment_mod = {"positive": 1.2, "negative": 0.7, "neutral": 1.0}.get(mention.sentiment, 1.0)
-            
-            # Calculate contribution
-            contribution = base_points * engagement * sub_weight * decay * sentiment_mod * mention.confidence
+        """Calculate raw buzz score from mentions (one compiled/vectorized pass, outliers clipped)"""
+        if not mentions:
+            return 0.0
+        now_ts = int(time.time())
+        n = len(mentions)
+
+        def column(values):
+            return np.fromiter(values, dtype=np.float64, count=n)
+
+        # Base points by mention type
+        base_points = column(MENTION_BASE_POINTS.get(m.type, 2) for m in mentions)
+
+        # Engagement inputs
+        score = column(m.score for m in mentions)
+        num_comments = column(m.num_comments for m in mentions)
+
+        # Subreddit weight
+        sub_weight = column(SUBREDDITS.get(m.subreddit, 1.0) for m in mentions)
+
+        # Recency decay (whole days old)
+        created = np.fromiter((m.created_utc for m in mentions), dtype=np.int64, count=n)
+        days_old = (now_ts - created) // SECONDS_PER_DAY
+
+        # Sentiment modifier and match confidence
+        sentiment_mod = column(MENTION_SENTIMENT_MOD.get(m.sentiment, 1.0) for m in mentions)
+        confidence = column(m.confidence for m in mentions)
+
+        # Calculate contributions
+        contributions = _mention_contributions(
+            base_points, score, num_comments, sub_weight, days_old, sentiment_mod, confidence
+        )
+
+        # Clip every mention at 25% of the *uncapped* total in one pass. This bounds
+        # outliers, but a mention can still exceed 25% of the clipped sum returned
+        # (with fewer than 4 mentions a strict share cap is unattainable anyway).
+        cap = contributions.sum() * MAX_SINGLE_POST_CONTRIBUTION
+        np.clip(contributions, None, cap, out=contributions)
+        for mention, contribution in zip(mentions, contributions.tolist()):
             mention.contribution = contribution
-            total += contribution
-        
-        return total
+
+        return float(contributions.sum())
 
     def calculate_news_contribution(self, news_articles: list) -> float:
         """Calculate buzz contribution from news: positive adds, negative hurts, weighted by recency."""
-        now = datetime.now(timezone.utc)
-        cutoff_30d = now.timestamp() - (30 * 24 * 3600)
-        sentiment_mod = {
-            "positive": NEWS_SENTIMENT_POSITIVE,
-            "negative": NEWS_SENTIMENT_NEGATIVE,
-            "neutral": NEWS_SENTIMENT_NEUTRAL,
-        }
-        total = 0.0
-        for article in news_articles:
-            if getattr(article, "published_ts", 0) < cutoff_30d:
-                continue
-            days_old = (now.timestamp() - article.published_ts) / (24 * 3600)
-            decay = math.exp(-DECAY_LAMBDA * days_old)
-            mod = sentiment_mod.get(article.sentiment, NEWS_SENTIMENT_NEUTRAL)
-            contribution = NEWS_BASE_POINTS * decay * mod
+        if not news_articles:
+            return 0.0
+        now_ts = int(time.time())
+        cutoff_30d = now_ts - DAYS_TO_TRACK * SECONDS_PER_DAY
+        n = len(news_articles)
+
+        published = np.fromiter((a.published_ts for a in news_articles), dtype=np.int64, count=n)
+        days_old = np.clip((now_ts - published) // SECONDS_PER_DAY, 0, DAYS_TO_TRACK)
+        sentiment_mod = np.fromiter(
+            (NEWS_SENTIMENT_MOD.get(a.sentiment, NEWS_SENTIMENT_NEUTRAL) for a in news_articles),
+            dtype=np.float64, count=n,
+        )
+        # Articles older than 30 days (or with no parsable date) contribute nothing
+        contributions = NEWS_BASE_POINTS * np.take(_DECAY_TABLE_ARR, days_old) * sentiment_mod
+        contributions[published < cutoff_30d] = 0.0
+
+        # Cap single article impact (no one piece > 25% of |total|), keeping its sign
+        cap = abs(contributions.sum()) * MAX_SINGLE_NEWS_CONTRIBUTION
+        if cap > 0:
+            np.clip(contributions, -cap, cap, out=contributions)
+
+        for article, contribution in zip(news_articles, contributions.tolist()):
             article.contribution = contribution
-            total += contribution
-        # Cap single article impact (no one piece > 25% of |total|)
-        if news_articles and total != 0:
-            abs_total = abs(total)
-            for article in news_articles:
-                if getattr(article, "published_ts", 0) < cutoff_30d:
-                    continue
-                cap = abs_total * MAX_SINGLE_NEWS_CONTRIBUTION
-                if abs(article.contribution) > cap:
-                    excess = abs(article.contribution) - cap
-                    if article.contribution < 0:
-                        total += excess
-                    else:
-                        total -= excess
-                    article.contribution = cap if article.contribution > 0 else -cap
-        return total
-
-    def normalize_score(self, raw_buzz: float, all_scores: list[float]) -> float:
-        """Normalize raw buzz to 0-100 scale using percentiles"""
-        if not all_scores or len(all_scores) < 2:
-            # Fallback: simple scaling
-            return min(100, max(0, raw_buzz))
-        
+        return float(contributions.sum())
+
+    def normalization_range(self, all_scores: list[float]) -> Optional[tuple[float, float]]:
+        """(p5, p95) of raw scores across prospects; sort once, reuse for every prospect.
+
+        Returns None with no scores (calculate_buzz_result then uses its no-comparison
+        heuristic). With a single score it returns the identity range (0, 100), so
+        normalize_score just clamps raw buzz to 0-100 as it always has.
+        """
+        if not all_scores:
+            return None
+        if len(all_scores) < 2:
+            return 0.0, 100.0
+
         sorted_scores = sorted(all_scores)
         p5_idx = max(0, int(len(sorted_scores) * 0.05))
         p95_idx = min(len(sorted_scores) - 1, int(len(sorted_scores) * 0.95))
-        
-        p5 = sorted_scores[p5_idx]
-        p95 = sorted_scores[p95_idx]
-        
+        return sorted_scores[p5_idx], sorted_scores[p95_idx]
+
+    def normalize_score(self, raw_buzz: float, norm_range: Optional[tuple[float, float]]) -> float:
+        """Normalize raw buzz to 0-100 scale using the (p5, p95) percentile range"""
+        if norm_range is None:
+            # Fallback: simple scaling
+            return min(100, max(0, raw_buzz))
+
+        p5, p95 = norm_range
         if p95 == p5:
             return 50.0  # All scores are the same
         
@@ -457,45 +933,37 @@ class BuzzCalculator:
         self,
         prospect: Prospect,
         mentions: list[Mention],
-        all_scores: list[float] = None,
+        norm_range: Optional[tuple[float, float]] = None,
         news_articles: list = None,
     ) -> BuzzResult:
         """Calculate complete buzz result for a prospect"""
-        now = datetime.now(timezone.utc)
+        now_ts = int(time.time())
         if news_articles is None:
             news_articles = []
 
         # Filter to past 30 days
-        cutoff_30d = now.timestamp() - (30 * 24 * 3600)
-        cutoff_7d = now.timestamp() - (7 * 24 * 3600)
+        cutoff_30d = now_ts - DAYS_TO_TRACK * SECONDS_PER_DAY
+        cutoff_7d = now_ts - 7 * SECONDS_PER_DAY
 
         mentions_30d = [m for m in mentions if m.created_utc >= cutoff_30d]
         mentions_7d = [m for m in mentions if m.created_utc >= cutoff_7d]
 
         # Reddit raw buzz
-        raw_buzz_reddit = self.calculate_raw_buzz(mentions_30d)
-        if mentions_30d:
-            max_contribution = max(m.contribution for m in mentions_30d)
-            if max_contribution > raw_buzz_reddit * MAX_SINGLE_POST_CONTRIBUTION:
-                excess = max_contribution - (raw_buzz_reddit * MAX_SINGLE_POST_CONTRIBUTION)
-                raw_buzz_reddit -= excess
+        raw_buzz_reddit = self.calculate_raw_buzz(mentions_30d)  # mentions clipped at 25% of uncapped total
 
         # News contribution (positive adds, negative hurts; recency-weighted)
         raw_buzz_news = self.calculate_news_contribution(news_articles)
         raw_buzz = raw_buzz_reddit + raw_buzz_news
 
         # Normalize
-        if all_scores:
-            buzz_score = self.normalize_score(raw_buzz, all_scores)
+        if norm_range:
+            buzz_score = self.normalize_score(raw_buzz, norm_range)
         else:
             # Simple scaling if no comparison data
             buzz_score = min(100, raw_buzz / 2)  # Rough heuristic
 
         # Calculate additional metrics
-        unique_days = len(set(
-            datetime.fromtimestamp(m.created_utc, tz=timezone.utc).date()
-            for m in mentions_30d
-        ))
+        unique_days = len({m.created_utc // SECONDS_PER_DAY for m in mentions_30d})  # UTC day ordinals
 
         negative_count = sum(1 for m in mentions_30d if m.sentiment == "negative")
         negative_ratio = negative_count / len(mentions_30d) if mentions_30d else 0
@@ -510,9 +978,9 @@ class BuzzCalculator:
             mention_count_30d=len(mentions_30d),
             days_with_mentions=unique_days,
             negative_ratio=round(negative_ratio, 2),
-            mentions=[asdict(m) for m in mentions_30d],
-            news_articles=[asdict(a) for a in news_articles],
-            last_updated=now.isoformat(),
+            mentions=mentions_30d,
+            news_articles=list(news_articles),
+            last_updated=datetime.fromtimestamp(now_ts, tz=timezone.utc).isoformat(),
         )
 
 
@@ -537,32 +1005,59 @@ def load_prospects(filepath: str) -> list[Prospect]:
         return [Prospect(**p) for p in data]
 
 
-def save_results(results: list[BuzzResult], filepath: str):
-    """Save buzz results to JSON file"""
-    Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-    
-    output = {
+def _dumps(obj) -> bytes:
+    """Serialize to compact JSON bytes (orjson when installed)"""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _write_results(f, results: list[BuzzResult]):
+    """Stream results as JSON to a binary file-like, one prospect record at a time"""
+    header = {
         "generated_at": datetime.now(timezone.utc).isoformat(),
         "prospect_count": len(results),
-        "results": [asdict(r) for r in results],
     }
-    
-    with open(filepath, "w") as f:
-        json.dump(output, f, indent=2)
-    
+    # Same top-level shape as before: {"generated_at", "prospect_count", "results": [...]}
+    f.write(_dumps(header)[:-1] + b',"results":[')
+    for i, result in enumerate(results):
+        if i:
+            f.write(b",")
+        f.write(b"\n" + _dumps(result.to_dict()))
+    f.write(b"\n]}\n")
+
+
+def save_results(results: list[BuzzResult], filepath: str) -> str:
+    """Save buzz results to JSON (zstd-compressed as <filepath>.zst if COMPRESS_RESULTS=1)"""
+    Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+
+    compress = os.environ.get("COMPRESS_RESULTS", "").strip() == "1"
+    if compress and not zstandard:
+        print("\nCOMPRESS_RESULTS=1 but zstandard is not installed; writing plain JSON")
+        compress = False
+
+    plain_path, zst_path = filepath, filepath + ".zst"
+    if compress:
+        filepath = zst_path
+        cctx = zstandard.ZstdCompressor(level=RESULTS_ZSTD_LEVEL)
+        with open(filepath, "wb") as raw, cctx.stream_writer(raw) as f:
+            _write_results(f, results)
+    else:
+        with open(filepath, "wb") as f:
+            _write_results(f, results)
+
+    # Never leave the other format's file from an earlier run behind as stale data
+    stale = Path(plain_path if compress else zst_path)
+    if stale.exists():
+        stale.unlink()
+
     print(f"\nResults saved to {filepath}")
+    return filepath
 
 
 def load_env():
-    """Load environment variables from .env file"""
-    env_path = Path(__file__).parent / ".env"
-    if env_path.exists():
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, value = line.split("=", 1)
-                    os.environ[key.strip()] = value.strip()
+    """Load environment variables from .env file (real env vars take precedence)"""
+    load_dotenv(Path(__file__).parent / ".env", override=False)
 
 
 def main():
@@ -596,7 +1091,8 @@ def main():
     scraper = None
     if reddit_ok:
         print("\nReddit: enabled")
-        scraper = RedditBuzzScraper(client_id, client_secret, user_agent)
+        cache = SearchCache(str(Path(__file__).parent / SEARCH_CACHE_FILE))
+        scraper = RedditBuzzScraper(client_id, client_secret, user_agent, cache=cache)
     else:
         print("\nReddit: skipped (no credentials — news-only mode)")
 
@@ -615,22 +1111,39 @@ def main():
     prospects = load_prospects(str(prospects_file))
     print(f"\nLoaded {len(prospects)} prospects to track")
 
-    # Scrape Reddit (if enabled) + news (if enabled) for each prospect
-    all_results = []
-    all_raw_scores = []
-
-    for i, prospect in enumerate(prospects, 1):
-        print(f"\n[{i}/{len(prospects)}] Scanning for {prospect.first_name} {prospect.last_name} ({prospect.team})...")
-
-        mentions = scraper.search_prospect(prospect) if scraper else []
+    # Scrape Reddit (if enabled) + news (if enabled) for each prospect, concurrently.
+    # Each source is its own task so GNews calls overlap the slower Reddit searches.
+    mentions_by_prospect = [[] for _ in prospects]
+    news_by_prospect = [[] for _ in prospects]
+    print(f"\nScanning with {MAX_WORKERS} workers...")
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        futures = {}
         if scraper:
-            print(f"  Reddit: {len(mentions)} mentions")
-
-        news_articles = []
+            start = 0
+            for batch in scraper.batch_prospects(prospects):
+                futures[ex.submit(scraper.search_prospects_bulk, batch)] = (start, "reddit")
+                start += len(batch)
         if news_scraper:
-            news_articles = news_scraper.search_prospect(prospect)
-            print(f"  News:   {len(news_articles)} articles")
+            for idx, prospect in enumerate(prospects):
+                futures[ex.submit(news_scraper.search_prospect, prospect)] = (idx, "news")
+        for i, future in enumerate(as_completed(futures), 1):
+            idx, source = futures[future]
+            if source == "reddit":
+                batch_mentions = future.result()
+                mentions_by_prospect[idx:idx + len(batch_mentions)] = batch_mentions
+                found = sum(len(m) for m in batch_mentions)
+                print(f"[{i}/{len(futures)}] Reddit batch of {len(batch_mentions)} prospects: {found} mentions")
+            else:
+                prospect = prospects[idx]
+                news_by_prospect[idx] = future.result()
+                print(f"[{i}/{len(futures)}] {prospect.first_name} {prospect.last_name} ({prospect.team}): "
+                      f"News: {len(news_by_prospect[idx])} articles")
+
+    # Keep the input order for normalization and output
+    all_results = []
+    all_raw_scores = []
 
+    for prospect, mentions, news_articles in zip(prospects, mentions_by_prospect, news_by_prospect):
         # Combined raw score (Reddit + news) for normalization
         raw_reddit = calculator.calculate_raw_buzz(mentions)
         raw_news = calculator.calculate_news_contribution(news_articles)
@@ -644,10 +1157,11 @@ def main():
     print("BUZZ SCORE RESULTS")
     print("=" * 60)
 
+    norm_range = calculator.normalization_range(all_raw_scores)
     final_results = []
     for prospect, mentions, news_articles in all_results:
         result = calculator.calculate_buzz_result(
-            prospect, mentions, all_raw_scores, news_articles=news_articles
+            prospect, mentions, norm_range, news_articles=news_articles
         )
         final_results.append(result)
 
@@ -656,10 +1170,10 @@ def main():
         news_part = f" | News: {len(result.news_articles)}" if result.news_articles else ""
         print(f"{emoji} {result.name:25} | Score: {result.buzz_score:5.1f} | 7d: {result.mention_count_7d:3} | 30d: {result.mention_count_30d:3}{news_part}")
         for art in result.news_articles[:2]:  # Top 2 headlines
-            title = (art.get("title") or "").strip()
+            title = (art.title or "").strip()
             if title:
                 short = title[:52] + "..." if len(title) > 55 else title
-                sent = art.get("sentiment", "neutral")
+                sent = art.sentiment
                 print(f"      📰 {short} ({sent})")
     
     # Sort by buzz score